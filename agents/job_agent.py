@@ -11,6 +11,8 @@ from tools.linkedin_search_tool import search_linkedin_jobs
 from tools.naukri_search_tool import search_naukri_jobs
 from tools.company_research_tool import research_company
 from tools.application_tracker_tool import save_jobs_to_notion
+from tools.job_alert_tool import create_job_alert
+from tools.job_store_tool import query_saved_jobs
 
 SEARCH_ANALYTICS_DATA = {
     "total_searches": 0,
@@ -54,6 +56,16 @@ def create_job_agent() -> AgentExecutor:
             func=save_jobs_to_notion,
             description="Use this tool to save jobs to a Notion database..."
         ),
+        Tool(
+            name="job_alert_creator",
+            func=create_job_alert,
+            description="Use this to set up a recurring background search that alerts the user to new listings. Input: 'role, location[, platform, ...]'."
+        ),
+        Tool(
+            name="saved_job_lookup",
+            func=query_saved_jobs,
+            description="Use this to look up jobs found in earlier searches without searching the job boards again. Input: 'search words[, days to look back]', e.g. 'Python Developer Chennai, 7'."
+        ),
         Tool(
             name="get_search_analytics",
             func=get_search_analytics,
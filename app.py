@@ -5,12 +5,20 @@ import logging
 import json
 import re
 import time
+import uuid
 from agents.job_agent import create_job_agent, SEARCH_ANALYTICS_DATA
+from tools.chat_history_store import archive_messages, load_messages, prune_history
+from tools.tracing import MAX_RECENT_TRACES, TracingCallbackHandler, get_trace, trace_span
 
 # --- CONFIGURATION ---
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 st.set_page_config(page_title="AI Job Search Agent", page_icon="🤖", layout="centered")
 
+CHAT_WINDOW = 20  # messages kept in session state and rendered on each rerun
+HISTORY_PAGE_SIZE = 20  # archived messages shown at a time when browsing older history
+MAX_ALERT_JOBS = 100  # alert listings shown in the sidebar at once
+SAVED_SEARCH_PAGE_SIZE = 10  # saved searches listed per page in the sidebar
+
 
 # --- AGENT INITIALIZATION ---
 @st.cache_resource
@@ -19,6 +27,15 @@ def get_agent_executor():
     return create_job_agent()
 
 
+@st.cache_resource
+def get_alert_scheduler():
+    """Starts the background job alert scheduler once per server process."""
+    from tools.job_alert_tool import JobAlertScheduler
+    scheduler = JobAlertScheduler()
+    scheduler.start()
+    return scheduler
+
+
 # --- UI HELPER FUNCTIONS ---
 def handle_resume_upload():
     """Handles the resume upload and analysis in the sidebar."""
@@ -42,8 +59,82 @@ def handle_resume_upload():
                 st.error(st.session_state.get("resume_data", "Could not parse resume."))
 
 
+def handle_job_alerts():
+    """Lets the user manage saved searches and shows listings found in the background."""
+    from tools.board_search import SUPPORTED_PLATFORMS
+    from tools.job_alert_tool import (add_saved_search, count_new_jobs, count_saved_searches, delete_saved_search,
+                                      get_new_jobs, list_saved_searches, mark_jobs_read)
+
+    with st.sidebar:
+        st.header("🔔 Job Alerts")
+
+        with st.form(key="job_alert_form", clear_on_submit=True):
+            role = st.text_input("Role")
+            location = st.text_input("Location")
+            platforms = st.multiselect("Platforms", SUPPORTED_PLATFORMS, default=list(SUPPORTED_PLATFORMS))
+            interval_hours = st.number_input("Check every (hours)", min_value=1, max_value=168, value=24)
+            if st.form_submit_button("Create Alert"):
+                if role.strip() and location.strip() and platforms:
+                    add_saved_search(role.strip(), location.strip(), platforms, int(interval_hours) * 60)
+                    st.success("Alert created!")
+                else:
+                    st.warning("Please fill in a role, a location and at least one platform.")
+
+        search_count = count_saved_searches()
+        if search_count:
+            with st.expander(f"Saved searches ({search_count})"):
+                page_count = -(-search_count // SAVED_SEARCH_PAGE_SIZE)
+                page = st.number_input("Page", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+                for search in list_saved_searches(SAVED_SEARCH_PAGE_SIZE, (page - 1) * SAVED_SEARCH_PAGE_SIZE):
+                    col1, col2 = st.columns([4, 1])
+                    col1.write(f"**{search['role']}** in {search['location']} ({search['platforms']})")
+                    if col2.button("🗑️", key=f"delete_alert_{search['id']}"):
+                        delete_saved_search(search["id"])
+                        st.rerun()
+
+        new_jobs = get_new_jobs(limit=MAX_ALERT_JOBS)
+        if new_jobs:
+            unread_count = count_new_jobs()
+            more = f", showing newest {len(new_jobs)}" if unread_count > len(new_jobs) else ""
+            st.subheader(f"New listings ({unread_count}{more})")
+            for job in new_jobs:
+                st.markdown(f"- **{job['title']}** at {job['company']} - [Apply Here]({job['url']})")
+            if st.button("Mark as read"):
+                mark_jobs_read(new_jobs)
+                st.rerun()
+
+
 def display_chat_messages():
-    """Displays the chat history and the job application tracker UI."""
+    """
+    Displays the recent chat window and the job application tracker UI.
+
+    Only the last CHAT_WINDOW messages live in session state; older ones are
+    archived and rendered read-only, one page at a time, when the user asks,
+    so a rerun never renders more than a page of older history.
+    """
+    archived_count = st.session_state.archived_count
+    if archived_count:
+        # older_page_end is the position just past the archived page being shown; 0 hides older history
+        page_end = st.session_state.older_page_end
+        col1, col2, col3 = st.columns(3)
+        if not page_end:
+            if col1.button(f"Load older messages ({archived_count} archived)"):
+                page_end = archived_count
+        else:
+            if page_end > HISTORY_PAGE_SIZE and col1.button("Earlier messages"):
+                page_end -= HISTORY_PAGE_SIZE
+            if page_end < archived_count and col2.button("Later messages"):
+                page_end = min(page_end + HISTORY_PAGE_SIZE, archived_count)
+            if col3.button("Hide older messages"):
+                page_end = 0
+        st.session_state.older_page_end = page_end
+
+        if page_end:
+            page_start = max(page_end - HISTORY_PAGE_SIZE, 0)
+            for message in load_messages(st.session_state.session_id, page_start, page_end):
+                with st.chat_message(message["role"]):
+                    st.markdown(message["content"], unsafe_allow_html=True)
+
     for message in st.session_state.messages:
         with st.chat_message(message["role"]):
             st.markdown(message["content"], unsafe_allow_html=True)
@@ -52,6 +143,19 @@ def display_chat_messages():
                 display_application_tracker(message)
 
 
+def trim_chat_history():
+    """Archives messages that have scrolled out of the chat window to keep session memory bounded."""
+    overflow = len(st.session_state.messages) - CHAT_WINDOW
+    if overflow > 0:
+        archive_messages(st.session_state.session_id, st.session_state.messages[:overflow],
+                         st.session_state.archived_count)
+        del st.session_state.messages[:overflow]
+        st.session_state.archived_count += overflow
+
+    trace_ids = st.session_state.get("trace_ids", [])
+    del trace_ids[:-MAX_RECENT_TRACES]
+
+
 def display_application_tracker(message):
     """Displays checkboxes and a save button for a list of jobs."""
     job_list = message["job_data"]
@@ -131,30 +235,29 @@ def process_user_prompt(prompt):
                     )
                     input_data["resume_context"] = resume_context
 
-                # Stream the agent's response properly
-                stream = st.session_state.agent_executor.stream(input_data)
-
-                for chunk in stream:
-                    # Handle job listings (structured dicts)
-                    if isinstance(chunk, dict) and "jobs" in chunk:
-                        for job in chunk["jobs"]:
-                            line = f"- **{job['title']}** at {job['company']} - [Apply Here]({job['url']})"
-                            final_response_text += line + "\n"
-                            st.markdown(line)
-
-                    # Handle final assistant text output
-                    elif isinstance(chunk, dict) and "output" in chunk:
-                        text = str(chunk["output"])
-                        final_response_text += text + "\n"
-                        st.markdown(text)
-
-                    # Handle plain string responses (fallback)
-                    elif isinstance(chunk, str):
-                        final_response_text += chunk + "\n"
-                        st.markdown(chunk)
-
-                # Save assistant message
-                st.session_state.messages.append({"role": "assistant", "content": final_response_text})
+                # Stream the agent's response properly, recording a trace of every step in the turn
+                with trace_span("chat_turn", "agent", prompt_chars=len(prompt)) as turn_span:
+                    st.session_state.setdefault("trace_ids", []).append(turn_span.trace_id)
+                    stream = st.session_state.agent_executor.stream(input_data, config={"callbacks": [TracingCallbackHandler()]})
+
+                    for chunk in stream:
+                        # Handle job listings (structured dicts)
+                        if isinstance(chunk, dict) and "jobs" in chunk:
+                            for job in chunk["jobs"]:
+                                line = f"- **{job['title']}** at {job['company']} - [Apply Here]({job['url']})"
+                                final_response_text += line + "\n"
+                                st.markdown(line)
+
+                        # Handle final assistant text output
+                        elif isinstance(chunk, dict) and "output" in chunk:
+                            text = str(chunk["output"])
+                            final_response_text += text + "\n"
+                            st.markdown(text)
+
+                        # Handle plain string responses (fallback)
+                        elif isinstance(chunk, str):
+                            final_response_text += chunk + "\n"
+                            st.markdown(chunk)
 
             except Exception as e:
                 final_response_text = "Sorry, I ran into a critical error. Please check the logs."
@@ -169,6 +272,7 @@ def process_user_prompt(prompt):
         assistant_message["timestamp"] = int(time.time())
 
     st.session_state.messages.append(assistant_message)
+    trim_chat_history()
     st.rerun()
 
 
@@ -196,6 +300,45 @@ def analytics_dashboard():
     else:
         st.info("No platform search data yet. Ask the agent to find some jobs!")
 
+    st.divider()
+
+    st.subheader("Job Board Health")
+    from tools.board_health import get_all_board_health
+    board_health = get_all_board_health()
+    if board_health:
+        health_df = pd.DataFrame(board_health)
+        health_df["error_rate"] = (health_df["error_rate"] * 100).round(1).astype(str) + "%"
+        st.dataframe(health_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No job boards have been called yet.")
+
+    st.divider()
+
+    st.subheader("Turn Waterfall")
+    trace_ids = [trace_id for trace_id in st.session_state.get("trace_ids", []) if get_trace(trace_id)]
+    if trace_ids:
+        turn_labels = {trace_id: f"Turn {i + 1}" for i, trace_id in enumerate(trace_ids)}
+        selected_trace = st.selectbox("Select a turn", list(reversed(trace_ids)), format_func=turn_labels.get)
+        spans = get_trace(selected_trace)
+        trace_start = spans[0]["start_time"]
+        span_df = pd.DataFrame([
+            {
+                "Step": f"{span['name']} ({span['span_id'][:4]})",
+                "Category": span["category"],
+                "Offset (ms)": (span["start_time"] - trace_start) * 1000,
+                "Duration (ms)": span["duration"] * 1000,
+                "Details": ", ".join(f"{k}={v}" for k, v in span["attributes"].items() if k != "input"),
+            }
+            for span in spans
+        ])
+        fig = px.bar(span_df, x="Duration (ms)", y="Step", base="Offset (ms)", color="Category",
+                     orientation="h", hover_data=["Details"], title="Where the time went in this turn")
+        fig.update_yaxes(autorange="reversed", categoryorder="array", categoryarray=span_df["Step"])
+        fig.update_xaxes(title_text="Time since turn start (ms)")
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No traced turns yet. Ask the agent something to see a per-step breakdown.")
+
 
 # --- MAIN APP LOGIC ---
 def main():
@@ -204,6 +347,7 @@ def main():
     st.caption("Your intelligent assistant for navigating the job market.")
 
     st.session_state.agent_executor = get_agent_executor()
+    get_alert_scheduler()
     if "messages" not in st.session_state:
         st.session_state.messages = [
             {
@@ -211,8 +355,14 @@ def main():
                 "content": "Hello! How can I help you today? Upload your resume in the sidebar for personalized results!",
             }
         ]
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+        prune_history()
+    st.session_state.setdefault("archived_count", 0)
+    st.session_state.setdefault("older_page_end", 0)
 
     handle_resume_upload()
+    handle_job_alerts()
 
     tab1, tab2 = st.tabs(["💬 Chat Agent", "📊 Analytics"])
 
@@ -0,0 +1,211 @@
+import argparse
+import csv
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
+
+from tools.board_search import SUPPORTED_PLATFORMS, BoardSearchError, search_board
+from tools.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+DEFAULT_WORKERS = 4
+CSV_FIELDS = ["query_role", "query_location", "platform", "title", "company", "url"]
+
+_thread_state = threading.local()
+
+
+def load_queries(path: str) -> list[tuple[str, str]]:
+    """
+    Reads role/location pairs from a file.
+
+    Supports JSONL ({"role": ..., "location": ...} per line), CSV with 'role'
+    and 'location' columns, or plain text with one 'role, location' per line.
+
+    Raises:
+        ValueError: If the file is not in the expected format.
+        OSError: If the file cannot be read.
+    """
+    queries = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            reader = csv.DictReader(f)
+            missing = {"role", "location"} - set(reader.fieldnames or [])
+            if missing:
+                raise ValueError(f"CSV header is missing column(s): {', '.join(sorted(missing))}.")
+            for row in reader:
+                queries.append(((row["role"] or "").strip(), (row["location"] or "").strip()))
+            return queries
+
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if path.endswith(".jsonl"):
+                try:
+                    item = json.loads(line)
+                    queries.append((item["role"].strip(), item["location"].strip()))
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+                    raise ValueError(f"Line {line_number}: expected a JSON object with 'role' and 'location' ({e}).")
+                continue
+            try:
+                role, location = [item.strip() for item in line.split(",")]
+            except ValueError:
+                raise ValueError(f"Line {line_number}: expected 'role, location', got '{line}'.")
+            queries.append((role, location))
+    return queries
+
+
+def _get_thread_agent():
+    """Returns an agent for the current worker thread; agents keep chat memory so they are not shared."""
+    if not hasattr(_thread_state, "agent"):
+        from agents.job_agent import create_job_agent
+        _thread_state.agent = create_job_agent()
+    return _thread_state.agent
+
+
+def _run_query(role: str, location: str, platforms: list[str], use_agent: bool) -> dict:
+    with trace_span("batch.query", "batch", role=role, location=location) as span:
+        result = _run_query_steps(role, location, platforms, use_agent)
+        span.set(jobs=len(result["jobs"]), failed_platforms=len(result["platform_errors"]))
+    return result
+
+
+def _run_query_steps(role: str, location: str, platforms: list[str], use_agent: bool) -> dict:
+    start = time.perf_counter()
+    result = {"role": role, "location": location, "jobs": [], "answer": None, "error": None,
+              "platform_errors": {}}
+    try:
+        if use_agent:
+            agent_executor = _get_thread_agent()
+            agent_executor.memory.clear()
+            response = agent_executor.invoke({"input": f"Find {role} jobs in {location}", "resume_context": ""})
+            result["answer"] = response["output"]
+        else:
+            for platform in platforms:
+                try:
+                    result["jobs"].extend(search_board(platform, role, location))
+                except BoardSearchError as e:
+                    logger.warning(f"Batch query '{role}, {location}' failed on {platform}: {e}")
+                    result["platform_errors"][platform] = str(e)
+    except Exception as e:
+        logger.error(f"Batch query '{role}, {location}' failed: {e}", exc_info=True)
+        result["error"] = str(e)
+    result["latency"] = time.perf_counter() - start
+    return result
+
+
+def run_batch(queries: list[tuple[str, str]], platforms: list[str] | None = None,
+              max_workers: int = DEFAULT_WORKERS, use_agent: bool = False) -> Iterator[dict]:
+    """
+    Runs many searches with bounded parallelism, yielding each result as it completes.
+
+    Args:
+        queries (list[tuple[str, str]]): Role/location pairs to search for.
+        platforms (list[str] | None): Boards to search. Defaults to all supported boards.
+        max_workers (int): Maximum number of queries running at the same time. Requests to each
+                           board are further limited by board_search.PLATFORM_CONCURRENCY.
+        use_agent (bool): Route each query through the agent instead of calling the boards directly.
+
+    Yields:
+        dict: The role, location, jobs (or agent answer), error, per-platform errors and latency of one query.
+    """
+    platforms = platforms or list(SUPPORTED_PLATFORMS)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-search") as executor:
+        futures = [executor.submit(_run_query, role, location, platforms, use_agent) for role, location in queries]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class _ResultWriter:
+    """Streams batch results to a JSONL or CSV file as they arrive."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", newline="", encoding="utf-8") if path != "-" else sys.stdout
+        self._csv = None
+        if path.endswith(".csv"):
+            self._csv = csv.DictWriter(self._file, fieldnames=CSV_FIELDS + ["answer", "error"], extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, result: dict) -> None:
+        if self._csv is None:
+            self._file.write(json.dumps(result) + "\n")
+            self._file.flush()
+            return
+
+        for job in result["jobs"]:
+            self._csv.writerow({"query_role": result["role"], "query_location": result["location"], **job})
+        for platform, error in result["platform_errors"].items():
+            self._csv.writerow({"query_role": result["role"], "query_location": result["location"],
+                                "platform": platform, "error": error})
+        if not result["jobs"] and not result["platform_errors"]:
+            self._csv.writerow({"query_role": result["role"], "query_location": result["location"],
+                                "answer": result["answer"], "error": result["error"]})
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+def _print_summary(latencies: list[float], failures: int, total_jobs: int, elapsed: float) -> None:
+    print("\n--- BATCH SUMMARY ---", file=sys.stderr)
+    print(f"Queries: {len(latencies)} ({failures} failed), jobs found: {total_jobs}", file=sys.stderr)
+    print(f"Wall time: {elapsed:.2f}s, throughput: {len(latencies) / max(elapsed, 1e-9):.2f} queries/s", file=sys.stderr)
+    if latencies:
+        ordered = sorted(latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"Latency: mean {statistics.mean(ordered):.2f}s, p50 {statistics.median(ordered):.2f}s, "
+              f"p95 {p95:.2f}s, max {ordered[-1]:.2f}s", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run job searches in batch without the Streamlit UI.")
+    parser.add_argument("queries", help="File of queries: .jsonl, .csv or text with 'role, location' per line.")
+    parser.add_argument("-o", "--output", default="-", help="Output file (.jsonl or .csv). Defaults to stdout as JSONL.")
+    parser.add_argument("-p", "--platforms", default=",".join(SUPPORTED_PLATFORMS),
+                        help="Comma-separated boards to search.")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help="Maximum parallel queries.")
+    parser.add_argument("--agent", action="store_true", help="Send each query through the agent.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    if args.agent:
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    try:
+        queries = load_queries(args.queries)
+    except (OSError, ValueError) as e:
+        parser.error(f"could not read queries from {args.queries}: {e}")
+    platforms = [p.strip().lower() for p in args.platforms.split(",") if p.strip()]
+    unknown = [p for p in platforms if p not in SUPPORTED_PLATFORMS]
+    if unknown:
+        parser.error(f"unsupported platform(s): {', '.join(unknown)}")
+    writer = _ResultWriter(args.output)
+    latencies, failures, total_jobs = [], 0, 0
+
+    start = time.perf_counter()
+    try:
+        for result in run_batch(queries, platforms, args.workers, args.agent):
+            writer.write(result)
+            latencies.append(result["latency"])
+            failures += bool(result["error"] or result["platform_errors"])
+            total_jobs += len(result["jobs"])
+            failed_platforms = f", failed on: {', '.join(result['platform_errors'])}" if result["platform_errors"] else ""
+            print(f"[{len(latencies)}/{len(queries)}] '{result['role']}, {result['location']}': "
+                  f"{len(result['jobs'])} job(s) in {result['latency']:.2f}s{failed_platforms}", file=sys.stderr)
+    finally:
+        writer.close()
+    _print_summary(latencies, failures, total_jobs, time.perf_counter() - start)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+import threading
+import time
+import logging
+from collections import deque
+
+# Set up a logger for this module
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+WINDOW_SIZE = 50  # most recent calls used for latency and error-rate statistics
+MIN_SAMPLES = 5  # latency samples needed before timeouts adapt
+TIMEOUT_PERCENTILE = 0.95
+TIMEOUT_MULTIPLIER = 2.0  # head-room over the observed percentile
+FAILURE_THRESHOLD = 3  # consecutive failures that trip the breaker
+ERROR_RATE_THRESHOLD = 0.5  # error rate over the window that trips the breaker
+COOLDOWN = 60  # seconds the breaker stays open before a trial call
+MAX_COOLDOWN = 15 * 60  # cap on the cooldown after repeated failed trials
+TRIAL_LEASE_MARGIN = 60  # seconds on top of the max timeout before a silent trial is abandoned
+
+# Default, minimum and maximum timeouts per board, in seconds. Naukri's covers page load and card wait together.
+TIMEOUT_BOUNDS = {
+    "linkedin": (10, 3, 20),
+    "naukri": (15, 5, 30),
+    "indeed": (10, 3, 20),
+}
+
+
+class BoardUnavailableError(Exception):
+    """Raised when a board's circuit breaker is open."""
+
+
+class BoardHealth:
+    """
+    Tracks latency and failures for one job board and acts as its circuit breaker.
+
+    The breaker opens after FAILURE_THRESHOLD consecutive failures, or when the
+    error rate over the window passes ERROR_RATE_THRESHOLD. While open, calls are
+    rejected until the cooldown expires; then one trial call is let through and
+    its outcome closes the breaker or reopens it with a doubled cooldown. The
+    trial is identified by the token check() returns, so calls that were
+    already running when the breaker opened only add to the statistics. A
+    trial that never reports back is abandoned after its lease expires, so a
+    hung call cannot block the board for good.
+    """
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self.default_timeout, self.min_timeout, self.max_timeout = TIMEOUT_BOUNDS.get(platform, (10, 3, 20))
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=WINDOW_SIZE)
+        self._outcomes = deque(maxlen=WINDOW_SIZE)
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._cooldown = COOLDOWN
+        self._trial_in_progress = False
+        self._trial_started_at = None
+        self._trial_token = 0
+        self.last_error = None
+
+    @property
+    def state(self) -> str:
+        """Returns 'closed', 'open' or 'half-open'."""
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self._cooldown:
+            return "half-open"
+        return "open"
+
+    def check(self) -> int | None:
+        """
+        Admits a call to the board, letting a single trial through when half-open.
+
+        Returns:
+            int | None: A trial token if this call is the half-open trial, to be passed
+                        back to record_success() or record_failure(); None for a normal call.
+
+        Raises:
+            BoardUnavailableError: If the breaker rejects the call.
+        """
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return None
+            if state == "half-open":
+                now = time.monotonic()
+                lease_expired = (self._trial_in_progress
+                                 and now - self._trial_started_at > self.max_timeout + TRIAL_LEASE_MARGIN)
+                if lease_expired:
+                    logger.warning(f"Trial call to {self.platform} never finished; letting a new trial through.")
+                if not self._trial_in_progress or lease_expired:
+                    self._trial_in_progress = True
+                    self._trial_started_at = now
+                    self._trial_token += 1
+                    return self._trial_token
+        raise BoardUnavailableError(
+            f"{self.platform} is temporarily unavailable after repeated failures ({self.last_error})."
+        )
+
+    def _is_current_trial(self, trial: int | None) -> bool:
+        return trial is not None and self._trial_in_progress and trial == self._trial_token
+
+    def timeout(self) -> float:
+        """Returns a timeout derived from the observed latency percentile, within the board's bounds."""
+        with self._lock:
+            if len(self._latencies) < MIN_SAMPLES:
+                return self.default_timeout
+            ordered = sorted(self._latencies)
+        percentile = ordered[min(len(ordered) - 1, int(len(ordered) * TIMEOUT_PERCENTILE))]
+        return max(self.min_timeout, min(self.max_timeout, percentile * TIMEOUT_MULTIPLIER))
+
+    def record_success(self, latency: float, trial: int | None = None) -> None:
+        """
+        Records a successful call.
+
+        Args:
+            latency (float): How long the call took.
+            trial (int | None): The token check() returned for this call.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            if self._is_current_trial(trial):
+                # Start the error rate afresh so failures from before the outage cannot reopen the breaker
+                self._outcomes.clear()
+                self._opened_at = None
+                self._cooldown = COOLDOWN
+                self._trial_in_progress = False
+                logger.info(f"Circuit breaker for {self.platform} closed.")
+            self._outcomes.append(True)
+            self._consecutive_failures = 0
+
+    def record_failure(self, reason: str, latency: float | None = None, trial: int | None = None) -> None:
+        """
+        Records a failed call.
+
+        Args:
+            reason (str): What went wrong, e.g. a timeout or "No job cards found".
+            latency (float | None): How long the call took, if it reached the board.
+            trial (int | None): The token check() returned for this call.
+        """
+        with self._lock:
+            if latency is not None:
+                self._latencies.append(latency)
+            self._outcomes.append(False)
+            self._consecutive_failures += 1
+            self.last_error = reason
+
+            if self._is_current_trial(trial):
+                self._trial_in_progress = False
+                self._cooldown = min(self._cooldown * 2, MAX_COOLDOWN)
+                self._opened_at = time.monotonic()
+                logger.warning(f"Circuit breaker for {self.platform} reopened for {self._cooldown}s: {reason}")
+                return
+
+            error_rate = self._outcomes.count(False) / len(self._outcomes)
+            tripped = (self._consecutive_failures >= FAILURE_THRESHOLD
+                       or (len(self._outcomes) >= MIN_SAMPLES and error_rate >= ERROR_RATE_THRESHOLD))
+            if tripped and self._opened_at is None:
+                self._opened_at = time.monotonic()
+                logger.warning(f"Circuit breaker for {self.platform} opened for {self._cooldown}s: {reason}")
+
+    def snapshot(self) -> dict:
+        """Returns the current health statistics for display."""
+        with self._lock:
+            state = self._state()
+            outcomes = list(self._outcomes)
+            latencies = sorted(self._latencies)
+        return {
+            "platform": self.platform,
+            "state": state,
+            "calls": len(outcomes),
+            "error_rate": outcomes.count(False) / len(outcomes) if outcomes else 0.0,
+            "p50_latency": latencies[len(latencies) // 2] if latencies else None,
+            "timeout": self.timeout(),
+            "last_error": self.last_error,
+        }
+
+
+_registry_lock = threading.Lock()
+_registry: dict[str, BoardHealth] = {}
+
+
+def get_board_health(platform: str) -> BoardHealth:
+    """Returns the process-wide health tracker for a board, shared by every session."""
+    with _registry_lock:
+        if platform not in _registry:
+            _registry[platform] = BoardHealth(platform)
+        return _registry[platform]
+
+
+def get_all_board_health() -> list[dict]:
+    """Returns a health snapshot for every board that has been called."""
+    with _registry_lock:
+        boards = list(_registry.values())
+    return [board.snapshot() for board in boards]
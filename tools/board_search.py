@@ -0,0 +1,66 @@
+import logging
+import threading
+
+from tools.linkedin_search_tool import search_linkedin_jobs
+from tools.naukri_search_tool import search_naukri_jobs
+from tools.indeed_search_tool import fetch_indeed_jobs
+
+# Set up a logger for this module
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+SUPPORTED_PLATFORMS = ("linkedin", "naukri", "indeed")
+NO_JOBS_MESSAGE = "No Jobs found for this query."
+PLATFORM_CONCURRENCY = {"linkedin": 2, "naukri": 1, "indeed": 2}  # parallel requests per board, process-wide
+
+# Shared by every caller (alert scheduler, batch runs), so their combined load on a board stays bounded
+_platform_limits = {platform: threading.Semaphore(PLATFORM_CONCURRENCY.get(platform, 1))
+                    for platform in SUPPORTED_PLATFORMS}
+
+
+class BoardSearchError(Exception):
+    """Raised when a job board search fails, as opposed to finding no jobs."""
+
+
+def search_board(platform: str, role: str, location: str) -> list[dict]:
+    """
+    Runs a single job board search and normalises the result to a list of jobs.
+
+    The board tools have different call signatures and report failures as
+    strings, which suits the agent but not code that loops over many searches,
+    so failures are raised instead. At most PLATFORM_CONCURRENCY[platform]
+    searches run against a board at once; further callers wait their turn.
+
+    Args:
+        platform (str): One of SUPPORTED_PLATFORMS.
+        role (str): The job role to search for.
+        location (str): The location to search in.
+
+    Returns:
+        list[dict]: The jobs found, which may be empty.
+
+    Raises:
+        BoardSearchError: If the board could not be searched.
+    """
+    platform = platform.strip().lower()
+    if platform not in SUPPORTED_PLATFORMS:
+        raise ValueError(f"Unsupported platform '{platform}'. Choose from: {', '.join(SUPPORTED_PLATFORMS)}.")
+
+    with _platform_limits[platform]:
+        if platform == "linkedin":
+            result = search_linkedin_jobs(f"{role}, {location}")
+        elif platform == "naukri":
+            result = search_naukri_jobs(f"{role}, {location}")
+        else:
+            try:
+                result = fetch_indeed_jobs(role=role, location=location)
+            except Exception as e:
+                raise BoardSearchError(f"indeed: {e}") from e
+
+    if result == NO_JOBS_MESSAGE:
+        logger.info(f"{platform} search for '{role}' in '{location}' returned no jobs.")
+        return []
+    if isinstance(result, str):
+        raise BoardSearchError(f"{platform}: {result}")
+    return result
+
@@ -0,0 +1,78 @@
+import os
+import json
+import sqlite3
+import time
+import zlib
+import logging
+
+# Set up a logger for this module
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+CHAT_HISTORY_DB_PATH = os.getenv("CHAT_HISTORY_DB_PATH", "chat_history.db")
+RETENTION_DAYS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_messages (
+    session_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (session_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_chat_messages_created ON chat_messages (created_at);
+"""
+
+_schema_ready = False
+
+
+def _connect() -> sqlite3.Connection:
+    """Opens a connection to the chat history database, creating the schema on first use."""
+    global _schema_ready
+    conn = sqlite3.connect(CHAT_HISTORY_DB_PATH, timeout=30)
+    if not _schema_ready:
+        conn.executescript(_SCHEMA)
+        _schema_ready = True
+    return conn
+
+
+def archive_messages(session_id: str, messages: list[dict], start_position: int) -> None:
+    """
+    Moves chat messages out of session state into the history store.
+
+    Each message is stored as zlib-compressed JSON, keyed by its position in
+    the conversation so pages of older turns can be read back in order.
+
+    Args:
+        session_id (str): The Streamlit session the messages belong to.
+        messages (list[dict]): The oldest messages still held in session state.
+        start_position (int): The conversation position of the first message.
+    """
+    now = time.time()
+    with _connect() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO chat_messages (session_id, position, created_at, payload) VALUES (?, ?, ?, ?)",
+            [(session_id, start_position + i, now, zlib.compress(json.dumps(message).encode("utf-8")))
+             for i, message in enumerate(messages)],
+        )
+    logger.info(f"Archived {len(messages)} chat message(s) for session {session_id}.")
+
+
+def load_messages(session_id: str, start: int, end: int) -> list[dict]:
+    """Returns archived messages with positions in [start, end), oldest first."""
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT payload FROM chat_messages WHERE session_id = ? AND position >= ? AND position < ? "
+            "ORDER BY position",
+            (session_id, start, end),
+        ).fetchall()
+    return [json.loads(zlib.decompress(payload)) for (payload,) in rows]
+
+
+def prune_history(retention_days: int = RETENTION_DAYS) -> None:
+    """Deletes archived messages older than the retention period."""
+    cutoff = time.time() - retention_days * 86400
+    with _connect() as conn:
+        deleted = conn.execute("DELETE FROM chat_messages WHERE created_at < ?", (cutoff,)).rowcount
+    if deleted:
+        logger.info(f"Pruned {deleted} archived chat message(s) older than {retention_days} days.")
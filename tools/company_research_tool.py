@@ -4,6 +4,8 @@ from serpapi import GoogleSearch
 from newspaper import Article, ArticleException
 import logging
 
+from tools.tracing import trace_span
+
 # Set up a logger for this module
 logger = logging.getLogger(__name__)
 
@@ -27,8 +29,10 @@ def research_company(company_name: str) -> str:
             "engine": "google",
             "api_key": os.getenv("SERPAPI_API_KEY")
         }
-        search = GoogleSearch(search_params)
-        results = search.get_dict()
+        with trace_span("company_research.search", "network", company=company_name) as span:
+            search = GoogleSearch(search_params)
+            results = search.get_dict()
+            span.set(results=len(results.get("organic_results", [])))
 
         if "organic_results" not in results or not results["organic_results"]:
             logger.warning(f"No organic results found for {company_name}")
@@ -45,8 +49,12 @@ def research_company(company_name: str) -> str:
     # 2. Scrape and parse the article from the URL
     try:
         article = Article(top_result_url)
-        article.download()
-        article.parse()
+        with trace_span("company_research.fetch", "network", url=top_result_url) as span:
+            article.download()
+            span.set(bytes=len(article.html or ""))
+        with trace_span("company_research.parse", "parse") as span:
+            article.parse()
+            span.set(chars=len(article.text))
 
         # Check if text was successfully extracted
         if not article.text:
@@ -1,21 +1,67 @@
+import time
 import requests
 from bs4 import BeautifulSoup
 
+from tools.board_health import BoardUnavailableError, get_board_health
+from tools.job_store_tool import save_jobs
+from tools.tracing import trace_span
+
+# --- Configuration Constants ---
+NO_RESULTS_CLASSES = ("jobsearch-NoResult", "jobsearch-NoResult-messageContainer")
+NO_RESULTS_TEXT = ("did not match any jobs",)
+
+
+def _is_no_results_page(soup: BeautifulSoup) -> bool:
+    """Returns whether Indeed served its empty-results page rather than a page without recognisable cards."""
+    if any(soup.find(class_=name) for name in NO_RESULTS_CLASSES):
+        return True
+    text = soup.get_text(" ").lower()
+    return any(marker in text for marker in NO_RESULTS_TEXT)
+
 
 def search_indeed_jobs(role: str, location: str) -> list[dict]:
     """Searches for jobs on Indeed."""
+    try:
+        return fetch_indeed_jobs(role, location)
+    except BoardUnavailableError as e:
+        print(f"WARNING: Skipping Indeed, {e}")
+        return []
+    except Exception as e:
+        print(f"ERROR (Indeed): {e}")
+        return []
+
+
+def fetch_indeed_jobs(role: str, location: str) -> list[dict]:
+    """Searches for jobs on Indeed, raising on failure instead of returning an empty list."""
     print(f"INFO: Searching Indeed for '{role}' in '{location}'...")
     url = f"https://in.indeed.com/jobs?q={role.replace(' ', '+')}&l={location.replace(' ', '+')}"
 
+    health = get_board_health("indeed")
+    trial = health.check()
+
+    start = time.perf_counter()
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with trace_span("indeed.fetch", "network", url=url) as span:
+            response = requests.get(url, headers=headers, timeout=health.timeout())
+            span.set(status_code=response.status_code, bytes=len(response.content))
+            response.raise_for_status()
+        latency = time.perf_counter() - start
+
+        with trace_span("indeed.parse", "parse", chars=len(response.text)) as span:
+            soup = BeautifulSoup(response.text, 'html.parser')
+            # Indeed uses a specific script tag to hold job data often
+            job_cards = soup.find_all('div', class_='job_seen_beacon')
+            span.set(cards=len(job_cards))
+        if not job_cards:
+            if _is_no_results_page(soup):
+                print(f"INFO: Indeed has no jobs for '{role}' in '{location}'.")
+                health.record_success(latency, trial=trial)
+                return []
+            # Recorded as a board failure by the handler below
+            raise RuntimeError("No job cards found on Indeed. The page structure may have changed.")
 
-        # Indeed uses a specific script tag to hold job data often
-        job_cards = soup.find_all('div', class_='job_seen_beacon')
         jobs = []
         for card in job_cards:
             title_element = card.find('h2', class_='jobTitle').find('a') if card.find('h2', class_='jobTitle') else None
@@ -29,8 +75,10 @@ def search_indeed_jobs(role: str, location: str) -> list[dict]:
                     "company": company_element.text.strip(),
                     "url": job_url
                 })
+        health.record_success(latency, trial=trial)
         print(f"INFO: Found {len(jobs)} jobs on Indeed.")
+        save_jobs(jobs, location=location)
         return jobs
     except Exception as e:
-        print(f"ERROR (Indeed): {e}")
-        return []
\ No newline at end of file
+        health.record_failure(str(e), time.perf_counter() - start, trial=trial)
+        raise
\ No newline at end of file
@@ -0,0 +1,316 @@
+import os
+import random
+import sqlite3
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from tools.board_search import SUPPORTED_PLATFORMS, search_board
+from tools.job_store_tool import job_key
+from tools.tracing import trace_span
+
+# Set up a logger for this module
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+ALERTS_DB_PATH = os.getenv("JOB_ALERTS_DB_PATH", "job_alerts.db")
+DEFAULT_INTERVAL_MINUTES = 24 * 60
+POLL_INTERVAL = 30  # seconds between scheduler checks for due searches
+MAX_JITTER = 300  # seconds of random delay added to each run to spread load
+MAX_WORKERS = 4  # saved searches executed at the same time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    role TEXT NOT NULL,
+    location TEXT NOT NULL,
+    platforms TEXT NOT NULL,
+    interval_minutes INTEGER NOT NULL,
+    next_run_at REAL NOT NULL,
+    last_run_at REAL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    search_id INTEGER NOT NULL,
+    job_key TEXT NOT NULL,
+    platform TEXT,
+    title TEXT,
+    company TEXT,
+    url TEXT,
+    first_seen_at REAL NOT NULL,
+    is_new INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (search_id, job_key)
+);
+CREATE TABLE IF NOT EXISTS seeded_platforms (
+    search_id INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    PRIMARY KEY (search_id, platform)
+);
+CREATE INDEX IF NOT EXISTS idx_saved_searches_next_run ON saved_searches (next_run_at);
+CREATE INDEX IF NOT EXISTS idx_seen_jobs_new ON seen_jobs (is_new, first_seen_at);
+"""
+
+_schema_ready = False
+
+
+def _connect() -> sqlite3.Connection:
+    """Opens a connection to the alerts database, creating the schema on first use."""
+    global _schema_ready
+    conn = sqlite3.connect(ALERTS_DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    if not _schema_ready:
+        conn.executescript(_SCHEMA)
+        _schema_ready = True
+    return conn
+
+
+def add_saved_search(role: str, location: str, platforms: list[str] | None = None,
+                     interval_minutes: int = DEFAULT_INTERVAL_MINUTES) -> int:
+    """
+    Saves a search so the scheduler re-runs it in the background.
+
+    The first run is scheduled after a random jitter so that many searches
+    created at once do not hit the boards together.
+
+    Args:
+        role (str): The job role to search for.
+        location (str): The location to search in.
+        platforms (list[str] | None): Boards to search. Defaults to all supported boards.
+        interval_minutes (int): How often to re-run the search.
+
+    Returns:
+        int: The id of the saved search.
+    """
+    platforms = [p.strip().lower() for p in (platforms or SUPPORTED_PLATFORMS) if p.strip()]
+    unknown = [p for p in platforms if p not in SUPPORTED_PLATFORMS]
+    if unknown:
+        raise ValueError(f"Unsupported platform(s): {', '.join(unknown)}.")
+
+    now = time.time()
+    with _connect() as conn:
+        cursor = conn.execute(
+            "INSERT INTO saved_searches (role, location, platforms, interval_minutes, next_run_at, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (role, location, ",".join(platforms), interval_minutes, now + random.uniform(0, MAX_JITTER), now),
+        )
+    logger.info(f"Saved search #{cursor.lastrowid} for '{role}' in '{location}' on {platforms}.")
+    return cursor.lastrowid
+
+
+def list_saved_searches(limit: int = -1, offset: int = 0) -> list[dict]:
+    """Returns saved searches, oldest first, optionally one page at a time."""
+    with _connect() as conn:
+        rows = conn.execute("SELECT * FROM saved_searches ORDER BY id LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+    return [dict(row) for row in rows]
+
+
+def count_saved_searches() -> int:
+    with _connect() as conn:
+        return conn.execute("SELECT COUNT(*) FROM saved_searches").fetchone()[0]
+
+
+def delete_saved_search(search_id: int) -> None:
+    """Deletes a saved search together with its seen-job index."""
+    with _connect() as conn:
+        conn.execute("DELETE FROM seen_jobs WHERE search_id = ?", (search_id,))
+        conn.execute("DELETE FROM seeded_platforms WHERE search_id = ?", (search_id,))
+        conn.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
+    logger.info(f"Deleted saved search #{search_id}.")
+
+
+def get_new_jobs(limit: int = -1) -> list[dict]:
+    """
+    Returns the listings found by background runs that have not been marked as read.
+
+    Reading does not change the flag, so every session and page refresh sees
+    the same listings until the user marks them as read. Listings beyond the
+    limit stay unread and are returned once newer ones are marked as read.
+
+    Args:
+        limit (int): Maximum number of listings to return; -1 for no limit.
+
+    Returns:
+        list[dict]: New jobs, newest first, each tagged with its saved search id.
+    """
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT search_id, job_key, platform, title, company, url, first_seen_at "
+            "FROM seen_jobs WHERE is_new = 1 ORDER BY first_seen_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def count_new_jobs() -> int:
+    with _connect() as conn:
+        return conn.execute("SELECT COUNT(*) FROM seen_jobs WHERE is_new = 1").fetchone()[0]
+
+
+def mark_jobs_read(jobs: list[dict]) -> None:
+    """Clears the 'new' flag on listings returned by get_new_jobs()."""
+    with _connect() as conn:
+        conn.executemany(
+            "UPDATE seen_jobs SET is_new = 0 WHERE search_id = ? AND job_key = ?",
+            [(job["search_id"], job["job_key"]) for job in jobs],
+        )
+
+
+def record_new_jobs(search_id: int, jobs: list[dict], mark_new: bool = True) -> list[dict]:
+    """
+    Diffs fetched jobs against the seen-job index and stores only unseen ones.
+
+    Args:
+        search_id (int): The saved search the jobs belong to.
+        jobs (list[dict]): Jobs fetched from the boards.
+        mark_new (bool): Whether stored jobs should be surfaced as new alerts.
+
+    Returns:
+        list[dict]: The jobs that had not been seen before for this search.
+    """
+    now = time.time()
+    new_jobs = []
+    with _connect() as conn:
+        for job in jobs:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO seen_jobs "
+                "(search_id, job_key, platform, title, company, url, first_seen_at, is_new) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (search_id, job_key(job), job.get("platform"), job.get("title"), job.get("company"),
+                 job.get("url"), now, int(mark_new)),
+            )
+            if cursor.rowcount:
+                new_jobs.append(job)
+    return new_jobs
+
+
+def _get_seeded_platforms(search_id: int) -> set[str]:
+    """Returns the boards that have already returned results for a saved search."""
+    with _connect() as conn:
+        rows = conn.execute("SELECT platform FROM seeded_platforms WHERE search_id = ?", (search_id,)).fetchall()
+    return {row["platform"] for row in rows}
+
+
+def _mark_platform_seeded(search_id: int, platform: str) -> None:
+    with _connect() as conn:
+        conn.execute("INSERT OR IGNORE INTO seeded_platforms (search_id, platform) VALUES (?, ?)",
+                     (search_id, platform))
+
+
+class JobAlertScheduler:
+    """
+    Background scheduler that re-runs saved searches and records new listings.
+
+    A single polling thread picks up due searches and hands them to a bounded
+    worker pool. search_board() limits the requests to each board, so however
+    many searches are due, only a few reach any one board at a time.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, poll_interval: float = POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-alert")
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """Starts the polling thread if it is not already running."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="job-alert-scheduler", daemon=True)
+        self._thread.start()
+        logger.info("Job alert scheduler started.")
+
+    def stop(self) -> None:
+        """Stops polling and waits for in-flight searches to finish."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+        logger.info("Job alert scheduler stopped.")
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                for search in self._claim_due_searches():
+                    self._executor.submit(self._run_search_safely, search)
+            except Exception as e:
+                logger.error(f"Job alert scheduler tick failed: {e}", exc_info=True)
+            self._stop_event.wait(self.poll_interval)
+
+    def _claim_due_searches(self) -> list[dict]:
+        """Selects due searches and pushes their next run forward so they are only picked once."""
+        now = time.time()
+        with _connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM saved_searches WHERE next_run_at <= ? ORDER BY next_run_at", (now,)
+            ).fetchall()
+            for row in rows:
+                next_run_at = now + row["interval_minutes"] * 60 + random.uniform(0, MAX_JITTER)
+                conn.execute(
+                    "UPDATE saved_searches SET next_run_at = ?, last_run_at = ? WHERE id = ?",
+                    (next_run_at, now, row["id"]),
+                )
+        return [dict(row) for row in rows]
+
+    def _run_search_safely(self, search: dict) -> None:
+        """Runs a saved search on a worker thread, logging failures that would otherwise be lost with the future."""
+        try:
+            with trace_span("alert.run_search", "alert", search_id=search["id"]) as span:
+                span.set(new_jobs=len(self.run_search(search)))
+        except Exception as e:
+            logger.error(f"Saved search #{search['id']} failed: {e}", exc_info=True)
+
+    def run_search(self, search: dict) -> list[dict]:
+        """
+        Runs one saved search across its boards and records the new listings.
+
+        The first time a board returns results for a search every listing is
+        unseen, so those jobs only seed the index instead of flooding the user
+        with alerts. Seeding is tracked per board, so a board that fails at
+        first is seeded by its first successful run.
+        """
+        seeded = _get_seeded_platforms(search["id"])
+        new_jobs, total = [], 0
+        for platform in search["platforms"].split(","):
+            try:
+                jobs = search_board(platform, search["role"], search["location"])
+            except Exception as e:
+                logger.error(f"Saved search #{search['id']} failed on {platform}: {e}")
+                continue
+
+            total += len(jobs)
+            if platform in seeded:
+                new_jobs.extend(record_new_jobs(search["id"], jobs))
+            elif jobs:
+                record_new_jobs(search["id"], jobs, mark_new=False)
+                _mark_platform_seeded(search["id"], platform)
+
+        logger.info(f"Saved search #{search['id']} found {total} job(s), {len(new_jobs)} new.")
+        return new_jobs
+
+
+def create_job_alert(query: str) -> str:
+    """
+    Creates a saved search that is re-run in the background.
+
+    Args:
+        query (str): A comma-separated string with the role, location and optional platforms.
+                     Example: "Python Developer, Chennai, linkedin, naukri"
+
+    Returns:
+        str: A confirmation message or an error string.
+    """
+    logger.info(f"Received job alert request: '{query}'")
+    parts = [item.strip() for item in query.split(',') if item.strip()]
+    if len(parts) < 2:
+        error_message = "Input error: Please provide the input as 'role, location[, platform, ...]'."
+        logger.error(error_message)
+        return error_message
+
+    role, location, platforms = parts[0], parts[1], parts[2:] or None
+    try:
+        search_id = add_saved_search(role, location, platforms)
+    except ValueError as e:
+        return f"Input error: {e}"
+    return f"Created job alert #{search_id} for '{role}' in '{location}'. New listings will appear in the sidebar."
@@ -0,0 +1,202 @@
+import os
+import re
+import sqlite3
+import time
+import logging
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from tools.tracing import trace_span
+
+# Set up a logger for this module
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+JOB_STORE_DB_PATH = os.getenv("JOB_STORE_DB_PATH", "job_store.db")
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 200
+IDENTITY_QUERY_PARAMS = ("jk",)  # Indeed keeps the job id in the query string
+# The board tools store display names; callers usually pass the ids from board_search.SUPPORTED_PLATFORMS
+PLATFORM_DISPLAY_NAMES = {"linkedin": "LinkedIn", "naukri": "Naukri.com", "indeed": "Indeed"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT NOT NULL UNIQUE,
+    platform TEXT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    url TEXT,
+    first_seen_at REAL NOT NULL,
+    last_seen_at REAL NOT NULL
+);
+DROP INDEX IF EXISTS idx_jobs_platform;
+CREATE INDEX IF NOT EXISTS idx_jobs_platform_nocase ON jobs (platform COLLATE NOCASE, first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE, first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location COLLATE NOCASE, first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen_at);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, content='jobs', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, location) VALUES (new.id, new.title, new.company, new.location);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location)
+    VALUES ('delete', old.id, old.title, old.company, old.location);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, company, location ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location)
+    VALUES ('delete', old.id, old.title, old.company, old.location);
+    INSERT INTO jobs_fts (rowid, title, company, location) VALUES (new.id, new.title, new.company, new.location);
+END;
+"""
+
+_schema_ready = False
+
+
+def _connect() -> sqlite3.Connection:
+    """Opens a connection to the job store, creating the schema on first use."""
+    global _schema_ready
+    conn = sqlite3.connect(JOB_STORE_DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    if not _schema_ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _schema_ready = True
+    return conn
+
+
+def job_key(job: dict) -> str:
+    """
+    Builds a stable identity for a job listing so repeat sightings can be detected.
+
+    Tracking query strings are stripped from the URL because the boards add
+    per-request parameters that would otherwise make every sighting unique.
+    """
+    url = job.get("url", "")
+    if url and url != "#":
+        parts = urlsplit(url)
+        query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if k in IDENTITY_QUERY_PARAMS])
+        url = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+        return f"{job.get('platform', '').lower()}|{url}"
+    return f"{job.get('platform', '').lower()}|{job.get('title', '').lower()}|{job.get('company', '').lower()}"
+
+
+def save_jobs(jobs: list[dict], location: str | None = None) -> int:
+    """
+    Writes fetched listings to the local store.
+
+    Listings already in the store only have their last-seen time refreshed.
+    Failures are logged rather than raised so that a store problem never
+    breaks a search.
+
+    Args:
+        jobs (list[dict]): Jobs returned by a board search tool.
+        location (str | None): The location that was searched for, since the boards
+                               do not return it per listing.
+
+    Returns:
+        int: The number of listings written.
+    """
+    if not jobs:
+        return 0
+    now = time.time()
+    try:
+        with trace_span("job_store.write", "storage", jobs=len(jobs)), _connect() as conn:
+            conn.executemany(
+                "INSERT INTO jobs (job_key, platform, title, company, location, url, first_seen_at, last_seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (job_key) DO UPDATE SET last_seen_at = excluded.last_seen_at",
+                [(job_key(job), job.get("platform"), job.get("title"), job.get("company"),
+                  job.get("location", location), job.get("url"), now, now) for job in jobs],
+            )
+        return len(jobs)
+    except Exception as e:
+        logger.error(f"Failed to write {len(jobs)} job(s) to the job store: {e}", exc_info=True)
+        return 0
+
+
+def _fts_query(text: str) -> str:
+    """Turns free text into an FTS5 query that matches listings containing every word."""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search_stored_jobs(text: str | None = None, platform: str | None = None, company: str | None = None,
+                       location: str | None = None, since: float | None = None,
+                       limit: int = DEFAULT_LIMIT) -> list[dict]:
+    """
+    Searches previously fetched listings without hitting the job boards.
+
+    Args:
+        text (str | None): Free-text words matched against title, company and location.
+        platform (str | None): Only return listings from this board, by id or display name,
+                               e.g. "linkedin" or "LinkedIn".
+        company (str | None): Only return listings from this company.
+        location (str | None): Only return listings for this searched location.
+        since (float | None): Only return listings first seen after this Unix time.
+        limit (int): Maximum number of listings to return.
+
+    Returns:
+        list[dict]: Matching listings, most recently first seen first.
+    """
+    clauses, params = [], []
+    match = _fts_query(text) if text else ""
+    if match:
+        clauses.append("jobs.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+        params.append(match)
+    if platform:
+        clauses.append("jobs.platform = ? COLLATE NOCASE")
+        params.append(PLATFORM_DISPLAY_NAMES.get(platform.strip().lower(), platform.strip()))
+    if company:
+        clauses.append("jobs.company = ? COLLATE NOCASE")
+        params.append(company)
+    if location:
+        clauses.append("jobs.location = ? COLLATE NOCASE")
+        params.append(location)
+    if since:
+        clauses.append("jobs.first_seen_at >= ?")
+        params.append(since)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    params.append(max(1, min(limit, MAX_LIMIT)))
+    with trace_span("job_store.query", "storage") as span, _connect() as conn:
+        rows = conn.execute(
+            f"SELECT platform, title, company, location, url, first_seen_at, last_seen_at FROM jobs {where} "
+            "ORDER BY first_seen_at DESC LIMIT ?",
+            params,
+        ).fetchall()
+        span.set(rows=len(rows))
+    return [dict(row) for row in rows]
+
+
+def query_saved_jobs(query: str) -> list[dict] | str:
+    """
+    Looks up listings the agent has already fetched, so past searches can be answered without re-scraping.
+
+    Args:
+        query (str): A comma-separated string with search words and an optional number of days to look back.
+                     Example: "Python Developer Chennai, 7"
+
+    Returns:
+        list[dict] | str: A list of job dictionaries or a message string.
+    """
+    logger.info(f"Received job store query: '{query}'")
+    text, _, days = query.rpartition(",")
+    if not text or not days.strip().isdigit():
+        text, days = query, ""
+
+    since = time.time() - int(days) * 86400 if days.strip() else None
+    try:
+        jobs = search_stored_jobs(text=text.strip(), since=since)
+    except Exception as e:
+        logger.error(f"Job store query failed: {e}", exc_info=True)
+        return f"An error occurred while searching saved jobs: {e}"
+
+    logger.info(f"Found {len(jobs)} stored jobs.")
+    for job in jobs:
+        job["first_seen"] = time.strftime("%Y-%m-%d", time.localtime(job.pop("first_seen_at")))
+        job.pop("last_seen_at")
+    return jobs if jobs else "No saved jobs found for this query."
@@ -1,10 +1,27 @@
 import requests
 from bs4 import BeautifulSoup
 import logging
+import time
+
+from tools.board_health import BoardUnavailableError, get_board_health
+from tools.job_store_tool import save_jobs
+from tools.tracing import trace_span
 
 # Set up a logger for this module
 logger = logging.getLogger(__name__)
 
+# --- Configuration Constants ---
+NO_RESULTS_CLASSES = ("no-results", "jobs-search-no-results-banner")
+NO_RESULTS_TEXT = ("couldn’t find a match", "couldn't find a match", "no matching jobs found")
+
+
+def _is_no_results_page(soup: BeautifulSoup) -> bool:
+    """Returns whether LinkedIn served its empty-results page rather than a page without recognisable cards."""
+    if any(soup.find(class_=name) for name in NO_RESULTS_CLASSES):
+        return True
+    text = soup.get_text(" ").lower()
+    return any(marker in text for marker in NO_RESULTS_TEXT)
+
 
 def search_linkedin_jobs(query: str) -> list[dict] | str:
     """
@@ -28,18 +45,36 @@ def search_linkedin_jobs(query: str) -> list[dict] | str:
     logger.info(f"Starting LinkedIn job search for '{role}' in '{location}'...")
     url = f"https://www.linkedin.com/jobs/search?keywords={role.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
 
+    health = get_board_health("linkedin")
+    try:
+        trial = health.check()
+    except BoardUnavailableError as e:
+        logger.warning(str(e))
+        return f"Error: {e}"
+
+    start = time.perf_counter()
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        with trace_span("linkedin.fetch", "network", url=url) as span:
+            response = requests.get(url, headers=headers, timeout=health.timeout())
+            span.set(status_code=response.status_code, bytes=len(response.content))
+            response.raise_for_status()
+        latency = time.perf_counter() - start
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        job_cards = soup.find_all('div', class_='base-card')
+        with trace_span("linkedin.parse", "parse", chars=len(response.text)) as span:
+            soup = BeautifulSoup(response.text, 'html.parser')
+            job_cards = soup.find_all('div', class_='base-card')
+            span.set(cards=len(job_cards))
 
         if not job_cards:
+            if _is_no_results_page(soup):
+                logger.info(f"LinkedIn has no jobs for '{role}' in '{location}'.")
+                health.record_success(latency, trial=trial)
+                return "No Jobs found for this query."
             logger.warning("No job cards found on LinkedIn. The page structure may have changed.")
-            return "No Jobs found for this query."
+            health.record_failure("No job cards found", latency, trial=trial)
+            return "Error: No job cards found on LinkedIn. The page structure may have changed."
 
         jobs = []
         for card in job_cards:
@@ -57,12 +92,16 @@ def search_linkedin_jobs(query: str) -> list[dict] | str:
                     "url": url_element['href']
                 })
 
+        health.record_success(latency, trial=trial)
         logger.info(f"Found {len(jobs)} jobs on LinkedIn.")
+        save_jobs(jobs, location=location)
         return jobs if jobs else "No Jobs found for this query."
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error during LinkedIn search: {e}")
+        health.record_failure(f"Network error: {e}", time.perf_counter() - start, trial=trial)
         return f"Error: Could not connect to LinkedIn. {e}"
     except Exception as e:
         logger.error(f"An unexpected error occurred during LinkedIn parsing: {e}", exc_info=True)
+        health.record_failure(f"Parse error: {e}", trial=trial)
         return f"An unexpected error occurred: {e}"
\ No newline at end of file
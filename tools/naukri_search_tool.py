@@ -1,15 +1,34 @@
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 import logging
 
+from tools.board_health import BoardUnavailableError, get_board_health
+from tools.job_store_tool import save_jobs
+from tools.tracing import trace_span
+
 # Set up a logger for this module
 logger = logging.getLogger(__name__)
 
 # --- Configuration Constants ---
-WAIT_TIME = 5  # seconds
+JOB_CARD_SELECTOR = "div.srp-jobtuple-wrapper, article.jobTuple"
+NO_RESULTS_SELECTOR = "div.no-result-container, div.noResultContainer, div.no-result"
+NO_RESULTS_TEXT = ("no results found", "no jobs found")
+MIN_CARD_WAIT = 0.5  # seconds left to find job cards once the page has loaded
+
+
+def _is_no_results_page(soup: BeautifulSoup) -> bool:
+    """Returns whether Naukri.com served its empty-results page rather than a page without recognisable cards."""
+    if soup.select_one(NO_RESULTS_SELECTOR):
+        return True
+    text = soup.get_text(" ").lower()
+    return any(marker in text for marker in NO_RESULTS_TEXT)
 
 
 def search_naukri_jobs(query: str) -> list[dict] | str:
@@ -34,6 +53,13 @@ def search_naukri_jobs(query: str) -> list[dict] | str:
     logger.info(f"Starting Naukri.com search for '{role}' in '{location}'...")
     url = f"https://www.naukri.com/{role.lower().replace(' ', '-')}-jobs-in-{location.lower()}"
 
+    health = get_board_health("naukri")
+    try:
+        trial = health.check()
+    except BoardUnavailableError as e:
+        logger.warning(str(e))
+        return f"Error: {e}"
+
     options = webdriver.ChromeOptions()
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -42,23 +68,49 @@ def search_naukri_jobs(query: str) -> list[dict] | str:
         "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
 
     driver = None
+    start = None
     try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.get(url)
-        logger.info(f"Waiting for {WAIT_TIME} seconds for page to load...")
-        time.sleep(WAIT_TIME)
+        # The board's adaptive timeout is one budget shared by the page load and the wait for job cards
+        budget = health.timeout()
+        with trace_span("naukri.browser_launch", "browser"):
+            service = Service(ChromeDriverManager().install())
+            driver = webdriver.Chrome(service=service, options=options)
+            driver.set_page_load_timeout(budget)
 
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        start = time.perf_counter()
+        with trace_span("naukri.fetch", "network", url=url):
+            driver.get(url)
+        wait_time = max(budget - (time.perf_counter() - start), MIN_CARD_WAIT)
+        logger.info(f"Waiting up to {wait_time:.1f} seconds for job cards or the empty-results page to load...")
+        with trace_span("naukri.page_wait", "browser", timeout=wait_time) as span:
+            try:
+                WebDriverWait(driver, wait_time).until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR)),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, NO_RESULTS_SELECTOR)),
+                ))
+            except TimeoutException:
+                logger.warning(f"Neither job cards nor the empty-results page appeared within {wait_time:.1f} seconds.")
+                span.set(timed_out=True)
+        latency = time.perf_counter() - start
 
-        job_elements = soup.find_all('div', class_='srp-jobtuple-wrapper')
-        if not job_elements:
-            logger.warning("Primary selector not found, trying fallback 'article.jobTuple'")
-            job_elements = soup.find_all('article', class_='jobTuple')
+        page_source = driver.page_source
+        with trace_span("naukri.parse", "parse", chars=len(page_source)) as span:
+            soup = BeautifulSoup(page_source, 'html.parser')
+
+            job_elements = soup.find_all('div', class_='srp-jobtuple-wrapper')
+            if not job_elements:
+                logger.warning("Primary selector not found, trying fallback 'article.jobTuple'")
+                job_elements = soup.find_all('article', class_='jobTuple')
+            span.set(cards=len(job_elements))
 
         if not job_elements:
+            if _is_no_results_page(soup):
+                logger.info(f"Naukri.com has no jobs for '{role}' in '{location}'.")
+                health.record_success(latency, trial=trial)
+                return "No Jobs found for this query."
             logger.warning("No job elements found on Naukri.com. The page structure may have changed.")
-            return "No Jobs found for this query."
+            health.record_failure("No job cards found", latency, trial=trial)
+            return "Error: No job cards found on Naukri.com. The page structure may have changed."
 
         jobs = []
         for job_element in job_elements:
@@ -75,10 +127,13 @@ def search_naukri_jobs(query: str) -> list[dict] | str:
                     "url": title_element['href']
                 })
 
+        health.record_success(latency, trial=trial)
         logger.info(f"Found {len(jobs)} jobs on Naukri.com.")
+        save_jobs(jobs, location=location)
         return jobs if jobs else "No Jobs found for this query."
     except Exception as e:
         logger.error(f"An unexpected error occurred during Naukri.com search: {e}", exc_info=True)
+        health.record_failure(str(e), time.perf_counter() - start if start is not None else None, trial=trial)
         return f"An unexpected error occurred: {e}"
     finally:
         if driver:
@@ -0,0 +1,220 @@
+import os
+import json
+import threading
+import time
+import uuid
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+# Set up a logger for this module
+logger = logging.getLogger(__name__)
+
+# --- Configuration Constants ---
+TRACE_FILE_PATH = os.getenv("JOB_AGENT_TRACE_PATH", "traces.json")
+MAX_RECENT_TRACES = 50  # traces kept in memory for the analytics waterfall
+IN_MEMORY_ROOT_SPANS = ("chat_turn",)  # only these traces are kept in memory; all traces go to the file
+MAX_TRACE_FILE_BYTES = 20 * 1024 * 1024  # trace file size before it is rotated to TRACE_FILE_PATH + ".1"
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+_export_lock = threading.Lock()
+_recent_traces: "OrderedDict[str, list[dict]]" = OrderedDict()
+_trace_file = None
+
+
+class Span:
+    """A timed step in a trace, such as an LLM call, a tool run, a fetch or a parse."""
+
+    def __init__(self, name: str, category: str, parent: "Span | None" = None, **attributes):
+        self.name = name
+        self.category = category
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_time = time.time()
+        self.duration = None
+        self._start = time.perf_counter()
+
+    @property
+    def root(self) -> "Span":
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span
+
+    def set(self, **attributes) -> None:
+        """Adds attributes such as sizes, counts or token usage to the span."""
+        self.attributes.update(attributes)
+
+    def end(self) -> None:
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._start
+            _export(self)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+def _export(span: Span) -> None:
+    """
+    Appends a finished span to the trace file and, for chat turns, the in-memory recent traces.
+
+    Background work such as alert runs and batch queries is only written to
+    the file, so it cannot push chat turns out of the analytics waterfall.
+
+    The file uses the Chrome Trace Event format, so it can be opened directly in
+    Perfetto (ui.perfetto.dev) or chrome://tracing. The format allows the closing
+    bracket to be omitted, which lets spans be appended as they finish. Once the
+    file passes MAX_TRACE_FILE_BYTES it replaces the previous rotated file.
+    """
+    event = {
+        "name": span.name,
+        "cat": span.category,
+        "ph": "X",
+        "ts": int(span.start_time * 1_000_000),
+        "dur": int(span.duration * 1_000_000),
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": {"trace_id": span.trace_id, "span_id": span.span_id, "parent_id": span.parent_id,
+                 "status": span.status, **span.attributes},
+    }
+    with _export_lock:
+        if span.root.name in IN_MEMORY_ROOT_SPANS:
+            spans = _recent_traces.setdefault(span.trace_id, [])
+            spans.append(span.to_dict())
+            _recent_traces.move_to_end(span.trace_id)
+            while len(_recent_traces) > MAX_RECENT_TRACES:
+                _recent_traces.popitem(last=False)
+
+        try:
+            _write_event(event)
+        except OSError as e:
+            logger.error(f"Failed to write span '{span.name}' to {TRACE_FILE_PATH}: {e}")
+
+
+def _write_event(event: dict) -> None:
+    """Writes one trace event through a shared file handle, rotating the file when it grows too large."""
+    global _trace_file
+    if _trace_file is not None and _trace_file.tell() >= MAX_TRACE_FILE_BYTES:
+        _trace_file.close()
+        _trace_file = None
+        os.replace(TRACE_FILE_PATH, TRACE_FILE_PATH + ".1")
+    if _trace_file is None:
+        _trace_file = open(TRACE_FILE_PATH, "a", encoding="utf-8")
+        if _trace_file.tell() == 0:
+            _trace_file.write("[\n")
+    _trace_file.write(json.dumps(event, default=str) + ",\n")
+    _trace_file.flush()
+
+
+def start_span(name: str, category: str, **attributes) -> Span:
+    """Starts a span as a child of the current one and makes it current. Close it with end_span()."""
+    span = Span(name, category, parent=_current_span.get(), **attributes)
+    _current_span.set(span)
+    return span
+
+
+def end_span(span: Span, error: BaseException | None = None) -> None:
+    """Ends a span started with start_span() and restores its parent as the current span."""
+    if error is not None:
+        span.status = "error"
+        span.set(error=str(error))
+    span.end()
+    if _current_span.get() is span:
+        _current_span.set(span.parent)
+
+
+@contextmanager
+def trace_span(name: str, category: str, **attributes) -> Iterator[Span]:
+    """
+    Records a span around a block of code.
+
+    Example:
+        with trace_span("linkedin.fetch", "network", url=url) as span:
+            response = requests.get(url)
+            span.set(bytes=len(response.content))
+    """
+    span = start_span(name, category, **attributes)
+    try:
+        yield span
+    except BaseException as e:
+        end_span(span, error=e)
+        raise
+    end_span(span)
+
+
+def get_trace(trace_id: str) -> list[dict]:
+    """Returns the finished spans of a trace, ordered by start time."""
+    with _export_lock:
+        spans = list(_recent_traces.get(trace_id, []))
+    return sorted(spans, key=lambda s: s["start_time"])
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback handler that records a span for every LLM call and tool run.
+
+    Spans are made current while they run, so fetch and parse spans recorded
+    inside a tool are nested under that tool's span.
+    """
+
+    def __init__(self):
+        self._spans: dict = {}
+
+    def _start(self, run_id, name: str, category: str, **attributes) -> None:
+        self._spans[run_id] = start_span(name, category, **attributes)
+
+    def _end(self, run_id, error: BaseException | None = None, **attributes) -> None:
+        span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        span.set(**attributes)
+        end_span(span, error=error)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, "llm", "llm", prompt_chars=sum(len(p) for p in prompts))
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        prompt_chars = sum(len(str(m.content)) for batch in messages for m in batch)
+        self._start(run_id, "llm", "llm", prompt_chars=prompt_chars)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        attributes = {}
+        generations = [g for batch in response.generations for g in batch]
+        if generations:
+            attributes["completion_chars"] = sum(len(g.text) for g in generations)
+            usage = getattr(getattr(generations[0], "message", None), "usage_metadata", None)
+            if usage:
+                attributes["input_tokens"] = usage.get("input_tokens")
+                attributes["output_tokens"] = usage.get("output_tokens")
+        self._end(run_id, **attributes)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=error)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        name = (serialized or {}).get("name", "tool")
+        self._start(run_id, f"tool.{name}", "tool", input=input_str)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id, output_chars=len(str(output)))
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=error)